@@ -6,6 +6,7 @@ and handles schema-specific migrations.
 """
 
 import asyncio
+import logging
 from logging.config import fileConfig
 from os import environ
 
@@ -13,7 +14,6 @@ from alembic import context
 from sqlalchemy import pool
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
-from src.larp_manager_server.config import get_settings
 from src.larp_manager_server.models.base import Base
 
 # This is the Alembic Config object, which provides
@@ -21,17 +21,33 @@ from src.larp_manager_server.models.base import Base
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. It is skipped when the caller
+# (e.g. scripts/init_db.py) has already configured logging.
+if config.config_file_name is not None and not logging.getLogger().hasHandlers():
     fileConfig(config.config_file_name)
 
 # Add your model's MetaData object here
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def get_database_url() -> str:
+    """Get the database URL for migrations.
+
+    Offline (--sql) runs only need the URL string, so DATABASE_URL is read
+    straight from the environment when set, skipping construction and
+    validation of the full application settings.
+    """
+    if context.is_offline_mode() and "DATABASE_URL" in environ:
+        return environ["DATABASE_URL"]
+
+    from src.larp_manager_server.config import get_settings
+
+    return get_settings().database.url
+
+
 # Set the database URL from settings
-settings = get_settings()
-config.set_main_option("sqlalchemy.url", settings.database.url)
+config.set_main_option("sqlalchemy.url", get_database_url())
 
 
 def run_migrations_offline() -> None:
@@ -60,24 +76,50 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    """Run migrations with the given connection."""
+    """Run migrations with the given connection.
+
+    All pending revisions run inside a single transaction, so an upgrade
+    spanning several revisions pays for one BEGIN/COMMIT pair. Revisions
+    that issue many raw statements can group them into a single round-trip
+    with larp_manager_server.utils.migrations.execute_batch().
+    """
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
         version_table_schema="larp_manager",
         include_schemas=True,
+        transaction_per_migration=False,
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
 
+def get_pool_options() -> dict:
+    """Get pool options for the migration engine.
+
+    A single-connection AsyncAdaptedQueuePool keeps one warm connection for
+    the whole migration run instead of reconnecting per checkout. It must be
+    the async-aware pool variant; the sync QueuePool is rejected by the
+    async engine. Set ALEMBIC_NULLPOOL=1 to fall back to NullPool, e.g. for
+    CI runs that need strict connection isolation.
+    """
+    if environ.get("ALEMBIC_NULLPOOL") == "1":
+        return {"poolclass": pool.NullPool}
+
+    return {
+        "poolclass": pool.AsyncAdaptedQueuePool,
+        "pool_size": 1,
+        "max_overflow": 0,
+    }
+
+
 async def run_async_migrations():
     """Run migrations in async mode."""
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        **get_pool_options(),
     )
 
     async with connectable.connect() as connection:
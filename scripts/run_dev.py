@@ -6,10 +6,12 @@ This script provides a convenient way to run the development server with
 proper environment setup and configuration.
 """
 
+import json
 import os
 import sys
 import subprocess
 import logging
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add project root to path
@@ -34,15 +36,11 @@ def check_environment():
     if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
         logger.warning("⚠️  Virtual environment not detected. Consider using a virtual environment.")
     
-    # Check if required packages are installed
+    # Check if required packages are installed (without importing them)
     required_packages = ["fastapi", "uvicorn", "sqlalchemy", "asyncpg", "alembic"]
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    missing_packages = [
+        package for package in required_packages if find_spec(package) is None
+    ]
     
     if missing_packages:
         logger.error(f"❌ Missing required packages: {', '.join(missing_packages)}")
@@ -53,6 +51,53 @@ def check_environment():
     return True
 
 
+def load_env_file(env_file: Path) -> None:
+    """
+    Load variables from a .env file without overriding existing ones.
+    
+    The parsed values are cached in a sibling .env.cache file keyed by the
+    .env modification time, so warm starts skip importing and running
+    python-dotenv's parser. The cache holds secrets in plain text, so it is
+    readable by the owner only. Values python-dotenv interpolated while
+    parsing (${VAR}) stay frozen in the cache until .env itself changes.
+    """
+    cache_file = env_file.with_name(env_file.name + ".cache")
+    mtime = env_file.stat().st_mtime_ns
+    
+    values = None
+    try:
+        cached = json.loads(cache_file.read_text())
+        if cached.get("mtime") == mtime:
+            values = cached["values"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    if values is None:
+        try:
+            from dotenv import dotenv_values
+        except ImportError:
+            logger.warning("python-dotenv not installed. Skipping .env file loading.")
+            return
+        
+        values = {
+            key: value
+            for key, value in dotenv_values(env_file).items()
+            if value is not None
+        }
+        try:
+            fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if hasattr(os, "fchmod"):
+                # The mode above only applies when the file is created
+                os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"mtime": mtime, "values": values}, f)
+        except OSError as e:
+            logger.debug(f"Could not write {cache_file.name}: {e}")
+    
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
 def setup_environment_variables():
     """Set up environment variables for development."""
     logger.info("Setting up development environment variables...")
@@ -74,30 +119,68 @@ def setup_environment_variables():
     env_file = project_root / ".env"
     if env_file.exists():
         logger.info("Loading environment variables from .env file")
-        try:
-            from dotenv import load_dotenv
-            load_dotenv(env_file)
-        except ImportError:
-            logger.warning("python-dotenv not installed. Skipping .env file loading.")
+        load_env_file(env_file)
+
+
+def get_event_loop() -> str:
+    """Get the uvicorn event loop implementation (set UVLOOP=0 to disable uvloop)."""
+    if os.environ.get("UVLOOP", "1") == "0":
+        return "asyncio"
+    
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "asyncio"
+    
+    return "uvloop"
 
 
-def run_server(host="0.0.0.0", port=8000, reload=True, log_level="info"):
-    """Run the development server."""
+def run_server(
+    host="0.0.0.0",
+    port=8000,
+    reload=True,
+    log_level="info",
+    workers=1,
+    environment="development",
+):
+    """
+    Run the development server.
+    
+    With more than one worker, or outside the development environment, the
+    server runs in a production-like mode: the file-watching reloader and
+    access log are disabled and the HTTP implementation is set explicitly.
+    """
     logger.info(f"Starting development server on {host}:{port}")
     
+    production_like = workers > 1 or environment != "development"
+    
     try:
         import uvicorn
         
+        options = {
+            "host": host,
+            "port": port,
+            "log_level": log_level,
+            "loop": get_event_loop(),
+        }
+        
+        if production_like:
+            logger.info(f"Running {workers} worker(s) without auto-reload")
+            options.update(
+                reload=False,
+                workers=workers,
+                access_log=False,
+                http="httptools" if find_spec("httptools") else "auto",
+            )
+        else:
+            options.update(
+                reload=reload,
+                reload_dirs=[str(project_root / "src")] if reload else None,
+                access_log=True,
+            )
+        
         # Configure uvicorn
-        uvicorn.run(
-            "src.larp_manager_server.main:app",
-            host=host,
-            port=port,
-            reload=reload,
-            log_level=log_level,
-            reload_dirs=[str(project_root / "src")],
-            access_log=True,
-        )
+        uvicorn.run("src.larp_manager_server.main:app", **options)
     except ImportError:
         logger.error("❌ uvicorn not installed. Please install it with: pip install uvicorn")
         return 1
@@ -127,6 +210,12 @@ def main():
         action="store_true",
         help="Disable auto-reload"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes; more than 1 disables auto-reload (default: 1)"
+    )
     parser.add_argument(
         "--log-level",
         default="info",
@@ -178,7 +267,9 @@ def main():
         host=args.host,
         port=args.port,
         reload=not args.no_reload,
-        log_level=args.log_level
+        log_level=args.log_level,
+        workers=args.workers,
+        environment=settings.environment,
     )
 
 
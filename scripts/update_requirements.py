@@ -13,6 +13,12 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
+try:
+    import click
+    from piptools.scripts.compile import cli as pip_compile_cli
+except ImportError:
+    pip_compile_cli = None
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -51,6 +57,9 @@ def print_error(message: str) -> None:
 
 def check_pip_tools() -> bool:
     """Check if pip-tools is installed."""
+    if pip_compile_cli is not None:
+        return True
+    
     try:
         subprocess.run(
             ["pip-compile", "--version"],
@@ -63,7 +72,14 @@ def check_pip_tools() -> bool:
 
 
 def backup_requirements_files() -> None:
-    """Create backup of existing requirements files."""
+    """
+    Create backup of existing requirements files.
+    
+    Backups are hard links where possible, so no data is copied. This is
+    safe because pip-compile writes its output atomically (a new file is
+    renamed over the old one), leaving the linked backup untouched; a copy
+    is made when linking isn't supported.
+    """
     project_root = Path.cwd()
     backup_dir = project_root / "requirements_backup"
     
@@ -75,14 +91,53 @@ def backup_requirements_files() -> None:
         file_path = project_root / filename
         if file_path.exists():
             backup_path = backup_dir / f"{filename}.bak"
-            shutil.copy2(file_path, backup_path)
+            backup_path.unlink(missing_ok=True)
+            try:
+                os.link(file_path, backup_path)
+            except OSError:
+                shutil.copy2(file_path, backup_path)
             print_step(f"Backed up {filename} to {backup_path}")
 
 
+def _run_pip_compile_in_process(cmd: List[str]) -> int:
+    """
+    Run pip-compile inside the current interpreter.
+    
+    Args:
+        cmd: Full pip-compile command line, including the program name
+        
+    Returns:
+        The pip-compile exit code
+    """
+    saved_argv = sys.argv
+    sys.argv = cmd
+    try:
+        pip_compile_cli.main(
+            args=cmd[1:],
+            prog_name=cmd[0],
+            standalone_mode=False,
+        )
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print_warning(f"stderr: {e.code}")
+        return 1
+    except click.ClickException as e:
+        print_warning(f"stderr: {e.format_message()}")
+        return e.exit_code
+    finally:
+        sys.argv = saved_argv
+
+
 def run_pip_compile(args: List[str]) -> subprocess.CompletedProcess:
     """
     Run pip-compile with the given arguments.
     
+    pip-compile is invoked in-process when pip-tools is importable, which
+    avoids starting a new interpreter per call; otherwise the pip-compile
+    executable is run as a subprocess.
+    
     Args:
         args: List of arguments to pass to pip-compile
         
@@ -103,21 +158,20 @@ def run_pip_compile(args: List[str]) -> subprocess.CompletedProcess:
     
     print_step(f"Running: {' '.join(cmd)}")
     
-    # Run the command
+    if pip_compile_cli is not None:
+        returncode = _run_pip_compile_in_process(cmd)
+        if returncode != 0:
+            print_error(f"Command failed with return code {returncode}")
+            raise subprocess.CalledProcessError(returncode, cmd)
+        return subprocess.CompletedProcess(cmd, returncode)
+    
+    # Run the command, streaming its output straight to the terminal
+    sys.stdout.flush()
     result = subprocess.run(
         cmd,
-        capture_output=True,
-        text=True,
         env=os.environ.copy()
     )
     
-    # Print output for debugging
-    if result.stdout:
-        print(result.stdout)
-    
-    if result.stderr:
-        print_warning(f"stderr: {result.stderr}")
-    
     if result.returncode != 0:
         print_error(f"Command failed with return code {result.returncode}")
         raise subprocess.CalledProcessError(result.returncode, cmd)
@@ -125,6 +179,56 @@ def run_pip_compile(args: List[str]) -> subprocess.CompletedProcess:
     return result
 
 
+def get_cache_dir() -> Path:
+    """
+    Get the persistent cache directory for pip and pip-tools.
+    
+    Keeping downloaded wheels and resolved dependency metadata between runs
+    lets a second compile pass (or a rerun after a failed approach) reuse
+    the work of the first instead of resolving from scratch.
+    
+    Returns:
+        The cache directory, from PIP_CACHE_DIR or .cache/ in the project
+    """
+    cache_dir = os.environ.get("PIP_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.cwd() / ".cache" / "pip"
+
+
+def compile_requirements(
+    output_file: str,
+    extra: Optional[str] = None,
+    constraint: Optional[str] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Compile pyproject.toml into a requirements file.
+    
+    Args:
+        output_file: Requirements file to write
+        extra: Optional extra to include (e.g. "dev")
+        constraint: Optional requirements file to use as a constraint
+        
+    Returns:
+        CompletedProcess object
+        
+    Raises:
+        subprocess.CalledProcessError: If pip-compile fails
+    """
+    # pip reads its cache location from the environment, which keeps it out
+    # of the command recorded in the generated file headers
+    cache_dir = get_cache_dir()
+    os.environ["PIP_CACHE_DIR"] = str(cache_dir)
+    args = [f"--cache-dir={cache_dir.parent / 'pip-tools'}"]
+    if constraint:
+        args.append(f"--constraint={constraint}")
+    if extra:
+        args.append(f"--extra={extra}")
+    args += [f"--output-file={output_file}", "pyproject.toml"]
+    
+    return run_pip_compile(args)
+
+
 def dev_first_approach() -> bool:
     """
     Try the dev-first approach: compile requirements-dev.txt first,
@@ -138,19 +242,11 @@ def dev_first_approach() -> bool:
         
         # Step 1: Compile requirements-dev.txt
         print_step("Compiling requirements-dev.txt...")
-        run_pip_compile([
-            "--extra=dev",
-            "--output-file=requirements-dev.txt",
-            "pyproject.toml"
-        ])
+        compile_requirements("requirements-dev.txt", extra="dev")
         
         # Step 2: Use requirements-dev.txt as constraint for requirements.txt
         print_step("Compiling requirements.txt with dev constraints...")
-        run_pip_compile([
-            "--constraint=requirements-dev.txt",
-            "--output-file=requirements.txt",
-            "pyproject.toml"
-        ])
+        compile_requirements("requirements.txt", constraint="requirements-dev.txt")
         
         print_success("Dev-first approach successful!")
         return True
@@ -173,19 +269,13 @@ def reverse_approach() -> bool:
         
         # Step 1: Compile requirements.txt
         print_step("Compiling requirements.txt...")
-        run_pip_compile([
-            "--output-file=requirements.txt",
-            "pyproject.toml"
-        ])
+        compile_requirements("requirements.txt")
         
         # Step 2: Use requirements.txt as constraint for requirements-dev.txt
         print_step("Compiling requirements-dev.txt with main constraints...")
-        run_pip_compile([
-            "--constraint=requirements.txt",
-            "--extra=dev",
-            "--output-file=requirements-dev.txt",
-            "pyproject.toml"
-        ])
+        compile_requirements(
+            "requirements-dev.txt", extra="dev", constraint="requirements.txt"
+        )
         
         print_success("Reverse approach successful!")
         return True
@@ -216,9 +306,10 @@ def validate_requirements_files() -> bool:
             print_error(f"{filename} is empty")
             return False
         
-        # Check if file contains some expected content
-        content = file_path.read_text()
-        if "# This file is autogenerated by pip-compile" not in content:
+        # Check if the file header contains the pip-compile marker
+        with file_path.open("rb") as f:
+            header = f.read(512)
+        if b"# This file is autogenerated by pip-compile" not in header:
             print_error(f"{filename} doesn't appear to be generated by pip-compile")
             return False
     
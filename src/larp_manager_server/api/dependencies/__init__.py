@@ -16,12 +16,10 @@ For specific functionality, import from the specialized modules directly.
 # Database dependencies
 from larp_manager_server.api.dependencies.database import (
     get_db_session,
-    get_db_session_with_error_handling,
 )
 
 # Context dependencies
 from larp_manager_server.api.dependencies.context import (
-    get_current_context,
     get_request_context,
     log_request_info,
     RequestContext,
@@ -36,11 +34,17 @@ from larp_manager_server.api.dependencies.auth import (
     get_player_role_dependency,
     get_gm_role_dependency,
     get_admin_role_dependency,
+    ROLE_DEPS,
+    UserRoleDep,
+    PlayerRoleDep,
+    GMRoleDep,
+    AdminRoleDep,
 )
 
 # Pagination dependencies
 from larp_manager_server.api.dependencies.pagination import (
     get_pagination_params,
+    PageInfo,
     PaginationParams,
 )
 
@@ -58,10 +62,8 @@ from larp_manager_server.api.dependencies.errors import (
 __all__ = [
     # Database
     "get_db_session",
-    "get_db_session_with_error_handling",
     
     # Context
-    "get_current_context", 
     "get_request_context",
     "log_request_info",
     "RequestContext",
@@ -74,9 +76,15 @@ __all__ = [
     "get_player_role_dependency", 
     "get_gm_role_dependency",
     "get_admin_role_dependency",
+    "ROLE_DEPS",
+    "UserRoleDep",
+    "PlayerRoleDep",
+    "GMRoleDep",
+    "AdminRoleDep",
     
     # Pagination
     "get_pagination_params",
+    "PageInfo",
     "PaginationParams",
     
     # Errors
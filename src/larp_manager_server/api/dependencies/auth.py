@@ -5,6 +5,7 @@ This module provides FastAPI dependencies for authentication and authorization.
 Currently contains placeholders for Phase 2 implementation.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
@@ -57,12 +58,21 @@ async def get_current_user_required(
     )
 
 
-async def require_role(required_role: str):
+@lru_cache(maxsize=16)
+def require_role(required_role: str):
     """
     Role-based access control dependency factory.
     
     This is a placeholder for the authorization system that will be
-    implemented in Phase 2.
+    implemented in Phase 2. The factory itself is synchronous so that
+    ``Depends(require_role("admin"))`` receives the checker callable;
+    the checker stays ``async`` because FastAPI runs sync dependencies
+    in a threadpool.
+    
+    Checkers are cached per role, so every call with the same role returns
+    the same callable. It holds no per-request state and is safe to reuse
+    across routers, and FastAPI's per-request dependency cache can dedupe
+    it when several dependencies in one request require the same role.
     
     Args:
         required_role: The role required to access the endpoint
@@ -82,7 +92,20 @@ async def require_role(required_role: str):
     return role_checker
 
 
-# Common role dependency factories (placeholders for Phase 2)
+# Pre-built role dependencies (placeholders for Phase 2)
+ROLE_DEPS = {
+    role: Depends(require_role(role))
+    for role in ("user", "player", "gm", "admin")
+}
+
+UserRoleDep = ROLE_DEPS["user"]
+PlayerRoleDep = ROLE_DEPS["player"]
+GMRoleDep = ROLE_DEPS["gm"]
+AdminRoleDep = ROLE_DEPS["admin"]
+
+
+# Common role dependency factories, kept for Depends(get_*_role_dependency())
+# call sites; they return the same cached checker as the pre-built dependencies
 def get_user_role_dependency():
     """Get user role dependency."""
     return require_role("user")
@@ -7,44 +7,76 @@ This module provides FastAPI dependencies for request context management.
 import logging
 from typing import Optional
 
-from fastapi import Depends, Request
+from fastapi import Request
 
-logger = logging.getLogger(__name__)
+from larp_manager_server.logging_config import get_logger
 
+logger = get_logger(__name__)
 
-def get_current_context(request: Request) -> dict:
+
+class RequestContext:
     """
-    Get current request context dependency.
+    Request context for storing request-specific information.
     
-    This dependency provides request context information that can be
-    used throughout the request lifecycle.
-    
-    Args:
-        request: The FastAPI request object
-        
-    Returns:
-        Dictionary containing request context information
+    Request details are read from the underlying request on access; the
+    URL string and query parameter dict are built on first access and
+    cached, so a field that is never used is never computed.
     """
-    return {
-        "request_id": getattr(request.state, "request_id", None),
-        "user_agent": request.headers.get("user-agent"),
-        "client_ip": request.client.host if request.client else None,
-        "method": request.method,
-        "url": str(request.url),
-        "path": request.url.path,
-        "query_params": dict(request.query_params),
-    }
-
-
-class RequestContext:
-    """Request context manager for storing request-specific information."""
     
-    def __init__(self, context: dict):
-        self.context = context
+    __slots__ = (
+        "_request",
+        "_url",
+        "_query_params",
+        "request_id",
+        "user_id",
+        "user_role",
+        "authenticated",
+    )
+    
+    def __init__(self, request: Request):
+        self._request = request
+        self._url: Optional[str] = None
+        self._query_params: Optional[dict] = None
+        self.request_id: Optional[str] = getattr(request.state, "request_id", None)
         self.user_id: Optional[str] = None
         self.user_role: Optional[str] = None
         self.authenticated: bool = False
     
+    @property
+    def user_agent(self) -> Optional[str]:
+        """User agent header of the request."""
+        return self._request.headers.get("user-agent")
+    
+    @property
+    def client_ip(self) -> Optional[str]:
+        """Client IP address of the request."""
+        client = self._request.client
+        return client.host if client else None
+    
+    @property
+    def method(self) -> str:
+        """HTTP method of the request."""
+        return self._request.method
+    
+    @property
+    def url(self) -> str:
+        """Full URL of the request."""
+        if self._url is None:
+            self._url = str(self._request.url)
+        return self._url
+    
+    @property
+    def path(self) -> str:
+        """URL path of the request."""
+        return self._request.url.path
+    
+    @property
+    def query_params(self) -> dict:
+        """Query parameters of the request."""
+        if self._query_params is None:
+            self._query_params = dict(self._request.query_params)
+        return self._query_params
+    
     def set_user_info(self, user_id: str, role: str) -> None:
         """Set user information in the context."""
         self.user_id = user_id
@@ -65,35 +97,54 @@ class RequestContext:
     
     def get_client_ip(self) -> Optional[str]:
         """Get client IP address."""
-        return self.context.get("client_ip")
+        return self.client_ip
     
     def get_request_id(self) -> Optional[str]:
         """Get request ID."""
-        return self.context.get("request_id")
+        return self.request_id
 
 
-def get_request_context(
-    context: dict = Depends(get_current_context)
-) -> RequestContext:
+async def get_request_context(request: Request) -> RequestContext:
     """
     Get request context object dependency.
     
     This dependency provides a RequestContext object that can be used
-    to store and retrieve request-specific information.
+    to store and retrieve request-specific information. The object is
+    built on first use and stored as request.state.ctx, so further
+    lookups within the same request return the same instance and code
+    outside the dependency tree (middleware, exception handlers) can
+    read it directly.
+    
+    Args:
+        request: The FastAPI request object
+        
+    Returns:
+        RequestContext for the current request
     """
-    return RequestContext(context)
+    context = getattr(request.state, "ctx", None)
+    if context is None:
+        context = RequestContext(request)
+        request.state.ctx = context
+    return context
 
 
-async def log_request_info(
-    context: RequestContext = Depends(get_request_context)
-) -> None:
+async def log_request_info(request: Request) -> None:
     """
     Log request information dependency.
     
     This dependency logs basic request information for debugging
-    and monitoring purposes.
+    and monitoring purposes. It reads straight from the request rather
+    than building a RequestContext.
+    
+    Args:
+        request: The FastAPI request object
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     logger.info(
-        f"Request: {context.context['method']} {context.context['path']} "
-        f"from {context.get_client_ip()}"
-    )
\ No newline at end of file
+        "Request: %s %s from %s",
+        request.method,
+        request.url.path,
+        request.client.host if request.client else None,
+    )
@@ -4,44 +4,32 @@ Database-related dependencies for LARP Manager Server.
 This module provides FastAPI dependencies for database operations.
 """
 
-import logging
 from typing import AsyncGenerator
 
-from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from larp_manager_server.database import db_manager
+from larp_manager_server.database import get_db_manager
+from larp_manager_server.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
+# The session dependency is a plain async generator on purpose: FastAPI wraps
+# it in a context manager itself, whereas an @asynccontextmanager object
+# passed to Depends() would be called and injected as-is, never entered.
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Get database session dependency.
     
     This dependency provides a database session for each request
-    and ensures proper cleanup and error handling.
+    and ensures proper cleanup and error handling. The session is
+    opened straight from the session factory and closed by its
+    context manager; database errors are turned into HTTP 500
+    responses by the global exception handlers.
     """
-    async for session in db_manager.get_session():
-        yield session
-
-
-async def get_db_session_with_error_handling() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Get database session with comprehensive error handling.
-    
-    This dependency provides a database session with automatic error handling
-    and transaction management for endpoints that need extra protection.
-    """
-    async for session in db_manager.get_session():
+    async with get_db_manager().get_session_factory()() as session:
         try:
             yield session
-        except Exception as e:
+        except Exception:
             await session.rollback()
-            logger.error(f"Database error: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database operation failed"
-            )
-        finally:
-            await session.close()
\ No newline at end of file
+            raise
@@ -4,23 +4,46 @@ Pagination dependencies for LARP Manager Server.
 This module provides FastAPI dependencies for pagination functionality.
 """
 
+from dataclasses import InitVar, dataclass, field
+from typing import TypedDict
 
+
+class PageInfo(TypedDict):
+    """Pagination metadata for list responses."""
+    
+    page: int
+    size: int
+    total_items: int
+    total_pages: int
+    has_next: bool
+    has_previous: bool
+
+
+@dataclass(slots=True, frozen=True)
 class PaginationParams:
-    """Pagination parameters for list endpoints."""
+    """
+    Pagination parameters for list endpoints.
     
-    def __init__(self, page: int = 1, size: int = 20, max_size: int = 100):
-        """
-        Initialize pagination parameters.
-        
-        Args:
-            page: Page number (1-based)
-            size: Number of items per page
-            max_size: Maximum allowed page size
-        """
-        self.page = max(1, page)
-        self.size = min(max_size, max(1, size))
-        self.offset = (self.page - 1) * self.size
-        self.limit = self.size
+    Args:
+        page: Page number (1-based)
+        size: Number of items per page
+        max_size: Maximum allowed page size
+    """
+    
+    page: int = 1
+    size: int = 20
+    max_size: InitVar[int] = 100
+    offset: int = field(init=False)
+    limit: int = field(init=False)
+    
+    def __post_init__(self, max_size: int) -> None:
+        """Clamp page and size and derive offset and limit."""
+        page = max(1, self.page)
+        size = min(max_size, max(1, self.size))
+        object.__setattr__(self, "page", page)
+        object.__setattr__(self, "size", size)
+        object.__setattr__(self, "offset", (page - 1) * size)
+        object.__setattr__(self, "limit", size)
     
     def get_offset(self) -> int:
         """Get offset for database queries."""
@@ -30,7 +53,7 @@ class PaginationParams:
         """Get limit for database queries."""
         return self.limit
     
-    def get_page_info(self, total_items: int) -> dict:
+    def get_page_info(self, total_items: int) -> PageInfo:
         """
         Get pagination information for response.
         
@@ -40,19 +63,22 @@ class PaginationParams:
         Returns:
             Dictionary containing pagination metadata
         """
-        total_pages = (total_items + self.size - 1) // self.size
+        page = self.page
+        size = self.size
+        # Ceiling division; size is always at least 1 after clamping
+        total_pages = -(-total_items // size)
         
         return {
-            "page": self.page,
-            "size": self.size,
+            "page": page,
+            "size": size,
             "total_items": total_items,
             "total_pages": total_pages,
-            "has_next": self.page < total_pages,
-            "has_previous": self.page > 1,
+            "has_next": page < total_pages,
+            "has_previous": page > 1,
         }
 
 
-def get_pagination_params(
+async def get_pagination_params(
     page: int = 1,
     size: int = 20
 ) -> PaginationParams:
@@ -69,4 +95,4 @@ def get_pagination_params(
     Returns:
         PaginationParams object with validated parameters
     """
-    return PaginationParams(page=page, size=size)
\ No newline at end of file
+    return PaginationParams(page=page, size=size)
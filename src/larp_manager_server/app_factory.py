@@ -5,19 +5,21 @@ This module provides the main application factory function that creates
 and configures the FastAPI application instance.
 """
 
-import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from larp_manager_server.config import get_settings
-from larp_manager_server.database import db_manager
+from larp_manager_server.database import get_db_manager
+from larp_manager_server.logging_config import get_logger
 from larp_manager_server.middleware.exception_handlers import setup_exception_handlers
+from larp_manager_server.middleware.request_id import RequestIDMiddleware
 from larp_manager_server.routes.health import setup_health_routes
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 @asynccontextmanager
@@ -30,6 +32,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info("Starting LARP Manager Server...")
     
+    db_manager = get_db_manager()
+    
     try:
         # Initialize database
         await db_manager.initialize()
@@ -44,7 +48,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("LARP Manager Server started successfully")
         
     except Exception as e:
-        logger.error(f"Failed to start application: {e}")
+        logger.error("Failed to start application: %s", e)
         raise
     
     yield
@@ -62,7 +66,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("LARP Manager Server shut down successfully")
         
     except Exception as e:
-        logger.error(f"Error during shutdown: {e}")
+        logger.error("Error during shutdown: %s", e)
 
 
 def create_app() -> FastAPI:
@@ -78,17 +82,27 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if settings.debug else None,
         openapi_url="/openapi.json" if settings.debug else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Add CORS middleware
+    allow_methods: tuple[str, ...]
+    if "*" in settings.cors_allow_methods:
+        allow_methods = ("*",)
+    else:
+        allow_methods = tuple(dict.fromkeys(m.upper() for m in settings.cors_allow_methods))
+    
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.cors_origins,
+        allow_origins=tuple(settings.cors_origins),
         allow_credentials=settings.cors_allow_credentials,
-        allow_methods=settings.cors_allow_methods,
-        allow_headers=settings.cors_allow_headers,
+        allow_methods=allow_methods,
+        allow_headers=tuple(settings.cors_allow_headers),
     )
     
+    # Added last so it wraps CORS and every log line has the request ID
+    app.add_middleware(RequestIDMiddleware)
+    
     # Set up exception handlers
     setup_exception_handlers(app)
     
@@ -12,19 +12,27 @@ This __init__.py provides convenient imports for the most commonly used configur
 For specific functionality, import from the specialized modules directly.
 """
 
+from functools import lru_cache
+
 # Import all settings classes
 from larp_manager_server.config.database import DatabaseSettings
 from larp_manager_server.config.security import SecuritySettings
 from larp_manager_server.config.logging import LoggingSettings
 from larp_manager_server.config.settings import Settings
 
-# Create global settings instance
-settings = Settings()
-
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
-    return settings
+    """
+    Get application settings.
+    
+    Settings are built on the first call and cached afterwards, so
+    importing this package does not parse the environment.
+    
+    Returns:
+        Settings: The application settings
+    """
+    return Settings()
 
 
 # Export commonly used items
@@ -33,6 +41,5 @@ __all__ = [
     "SecuritySettings", 
     "LoggingSettings",
     "Settings",
-    "settings",
     "get_settings",
 ]
\ No newline at end of file
@@ -16,8 +16,10 @@ class DatabaseSettings(BaseSettings):
         description="Database connection URL"
     )
     pool_size: int = Field(default=20, description="Database connection pool size")
-    max_overflow: int = Field(default=0, description="Maximum overflow connections")
+    max_overflow: int = Field(default=10, description="Maximum overflow connections")
     pool_timeout: int = Field(default=30, description="Pool timeout in seconds")
     pool_recycle: int = Field(default=1800, description="Pool recycle time in seconds")
+    pool_pre_ping: bool = Field(default=True, description="Test connections for liveness on checkout")
+    health_check_ttl: float = Field(default=2.0, description="Seconds a health check result is reused")
     
-    model_config = SettingsConfigDict(env_prefix="DATABASE_")
\ No newline at end of file
+    model_config = SettingsConfigDict(env_prefix="DATABASE_", frozen=True)
\ No newline at end of file
@@ -14,7 +14,7 @@ class LoggingSettings(BaseSettings):
     level: str = Field(default="INFO", description="Log level")
     format: str = Field(default="json", description="Log format (json or text)")
     
-    model_config = SettingsConfigDict(env_prefix="LOG_")
+    model_config = SettingsConfigDict(env_prefix="LOG_", frozen=True)
     
     @field_validator("level")
     @classmethod
@@ -25,4 +25,4 @@ class SecuritySettings(BaseSettings):
         description="Refresh token expiration time in days"
     )
     
-    model_config = SettingsConfigDict(env_prefix="SECURITY_")
\ No newline at end of file
+    model_config = SettingsConfigDict(env_prefix="SECURITY_", frozen=True)
\ No newline at end of file
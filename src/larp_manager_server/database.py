@@ -5,7 +5,9 @@ This module provides async database connectivity using SQLAlchemy 2.0 with Async
 It includes connection pooling, session management, and health check functionality.
 """
 
-import logging
+import asyncio
+import time
+from functools import lru_cache
 from typing import AsyncGenerator, Optional
 
 from sqlalchemy import text
@@ -15,9 +17,36 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from larp_manager_server.config import Settings, get_settings
+from larp_manager_server.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Health check statements, built once instead of on every probe
+SELECT_ONE = text("SELECT 1")
+SCHEMA_CHECK = text(
+    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = 'larp_manager'"
+)
+
+# Schema and extension setup sent as one statement, i.e. one round-trip.
+# Each step swallows the errors raised when concurrent workers race to
+# create the same object, keeping startup idempotent.
+CREATE_SCHEMA_SQL = """\
+DO $$
+BEGIN
+    BEGIN
+        CREATE SCHEMA IF NOT EXISTS larp_manager;
+    EXCEPTION WHEN duplicate_schema OR unique_violation THEN
+        NULL;
+    END;
+    BEGIN
+        CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+    EXCEPTION WHEN duplicate_object OR unique_violation THEN
+        NULL;
+    END;
+END
+$$"""
 
 
 class DatabaseManager:
@@ -39,6 +68,9 @@ class DatabaseManager:
         self.engine: Optional[AsyncEngine] = None
         self.session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._initialized = False
+        self._schema_verified = False
+        self._health_check_cache: Optional[tuple[float, dict]] = None
+        self._health_check_task: Optional[asyncio.Future] = None
     
     async def initialize(self) -> None:
         """Initialize the database connection and session factory."""
@@ -65,6 +97,8 @@ class DatabaseManager:
         self.engine = None
         self.session_factory = None
         self._initialized = False
+        self._health_check_cache = None
+        self._health_check_task = None
         
         logger.info("Database manager closed")
     
@@ -72,15 +106,17 @@ class DatabaseManager:
         """Create and configure the database engine."""
         engine = create_async_engine(
             self.settings.database.url,
+            poolclass=AsyncAdaptedQueuePool,
             pool_size=self.settings.database.pool_size,
             max_overflow=self.settings.database.max_overflow,
             pool_timeout=self.settings.database.pool_timeout,
             pool_recycle=self.settings.database.pool_recycle,
+            pool_pre_ping=self.settings.database.pool_pre_ping,
             echo=self.settings.debug,
             future=True,
         )
         
-        logger.info(f"Database engine created with pool_size={self.settings.database.pool_size}")
+        logger.info("Database engine created with pool_size=%s", self.settings.database.pool_size)
         return engine
     
     def _create_session_factory(self) -> async_sessionmaker[AsyncSession]:
@@ -120,13 +156,34 @@ class DatabaseManager:
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
     
-    async def health_check(self) -> dict:
+    def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """
+        Get the session factory.
+        
+        Returns:
+            async_sessionmaker: The factory used to open database sessions
+        """
+        self._ensure_initialized()
+        
+        if self.session_factory is None:
+            raise RuntimeError("Session factory not initialized")
+        
+        return self.session_factory
+    
+    async def health_check(self, force_recheck: bool = False) -> dict:
         """
         Check database connectivity and health.
         
+        Results are reused for settings.database.health_check_ttl seconds
+        and concurrent callers share a single in-flight check. Once the
+        larp_manager schema has been seen (or created by create_schema),
+        later checks skip the schema query.
+        
+        Args:
+            force_recheck: Bypass the cached result and query for the
+                schema even if it was seen before
+        
         Returns:
             dict: Health check results with status and details
         """
@@ -137,29 +194,55 @@ class DatabaseManager:
                 "details": None
             }
         
+        if force_recheck:
+            return await self._run_health_check(self.engine, force_recheck=True)
+        
+        cached = self._health_check_cache
+        if cached is not None and time.monotonic() - cached[0] < self.settings.database.health_check_ttl:
+            return cached[1]
+        
+        task = self._health_check_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._run_health_check(self.engine, force_recheck=False))
+            self._health_check_task = task
+        # Shield the shared check so one cancelled caller doesn't cancel it for all
+        return await asyncio.shield(task)
+    
+    async def _run_health_check(self, engine: AsyncEngine, force_recheck: bool) -> dict:
+        """
+        Run the health check queries and cache the result.
+        
+        Args:
+            engine: The initialized engine to check
+            force_recheck: Query for the schema even if it was seen before
+        
+        Returns:
+            dict: Health check results with status and details
+        """
         try:
-            async with self.engine.begin() as conn:
+            async with engine.begin() as conn:
                 # Test basic connectivity
-                result = await conn.execute(text("SELECT 1"))
-                test_value = result.scalar()
+                select_one = await conn.execute(SELECT_ONE)
+                test_value = select_one.scalar()
                 
                 # Check if we can access the larp_manager schema
-                schema_check = await conn.execute(
-                    text("SELECT schema_name FROM information_schema.schemata WHERE schema_name = 'larp_manager'")
-                )
-                schema_exists = schema_check.scalar() is not None
+                if self._schema_verified and not force_recheck:
+                    schema_exists = True
+                else:
+                    schema_check = await conn.execute(SCHEMA_CHECK)
+                    schema_exists = schema_check.scalar() is not None
+                    self._schema_verified = schema_exists
                 
                 # Get connection pool stats
-                pool = self.engine.pool
+                pool = engine.pool
                 pool_stats = {
                     "pool_size": pool.size(),
                     "checked_in": pool.checkedin(),
                     "checked_out": pool.checkedout(),
                     "overflow": pool.overflow(),
-                    "invalid": pool.invalid(),
                 }
                 
-                return {
+                result = {
                     "status": "healthy",
                     "test_query": test_value == 1,
                     "schema_exists": schema_exists,
@@ -167,12 +250,15 @@ class DatabaseManager:
                     "error": None
                 }
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
-            return {
+            logger.error("Database health check failed: %s", e)
+            result = {
                 "status": "unhealthy",
                 "error": str(e),
                 "details": None
             }
+        
+        self._health_check_cache = (time.monotonic(), result)
+        return result
     
     async def create_schema(self) -> None:
         """Create the larp_manager schema if it doesn't exist."""
@@ -183,15 +269,13 @@ class DatabaseManager:
         
         try:
             async with self.engine.begin() as conn:
-                # Create schema if it doesn't exist
-                await conn.execute(text("CREATE SCHEMA IF NOT EXISTS larp_manager"))
-                
-                # Install UUID extension if needed
-                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS \"uuid-ossp\""))
-                
-                logger.info("larp_manager schema created successfully")
+                # Create schema and install UUID extension if needed
+                await conn.exec_driver_sql(CREATE_SCHEMA_SQL)
+            
+            self._schema_verified = True
+            logger.info("larp_manager schema created successfully")
         except Exception as e:
-            logger.error(f"Failed to create larp_manager schema: {e}")
+            logger.error("Failed to create larp_manager schema: %s", e)
             raise
     
     async def get_engine(self) -> AsyncEngine:
@@ -213,12 +297,16 @@ class DatabaseManager:
         """Check if the database manager is initialized."""
         return self._initialized
     
-    async def execute_raw_sql(self, sql: str) -> dict:
+    async def execute_raw_sql(self, sql: str, *, limit: Optional[int] = None) -> dict:
         """
         Execute raw SQL and return results.
         
+        Rows are streamed from the database rather than fetched all at
+        once, so a limit caps memory use as well as the result size.
+        
         Args:
             sql: The SQL query to execute
+            limit: Maximum number of rows to return; None returns all rows
             
         Returns:
             dict: Query results
@@ -230,12 +318,35 @@ class DatabaseManager:
         
         try:
             async with self.engine.begin() as conn:
-                result = await conn.execute(text(sql))
-                return {"success": True, "result": result.fetchall()}
+                result = await conn.stream(text(sql))
+                rows = []
+                async for row in result:
+                    rows.append(row)
+                    if limit is not None and len(rows) >= limit:
+                        break
+                await result.close()
+                return {"success": True, "result": rows}
         except Exception as e:
-            logger.error(f"Raw SQL execution failed: {e}")
+            logger.error("Raw SQL execution failed: %s", e)
             return {"success": False, "error": str(e)}
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_db_manager() -> DatabaseManager:
+    """
+    Get the global database manager instance.
+    
+    The manager (and with it the application settings) is created on the
+    first call rather than when this module is imported.
+    
+    Returns:
+        DatabaseManager: The shared database manager
+    """
+    return DatabaseManager()
+
+
+def __getattr__(name: str) -> DatabaseManager:
+    """Resolve the legacy module-level db_manager lazily."""
+    if name == "db_manager":
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,21 +5,166 @@ This module provides centralized logging configuration that can be
 used across the application.
 """
 
+import atexit
 import logging
-from typing import Dict, Any
+import queue
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+import orjson
 
 from larp_manager_server.config import get_settings
 
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# ID of the HTTP request being handled, set by RequestIDMiddleware
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else on a record came from extra=
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger for an application module.
+    
+    Application modules obtain their loggers here rather than from
+    logging.getLogger() directly, so the logging backend can be changed
+    in one place.
+    
+    Args:
+        name: Logger name, normally the module's __name__
+        
+    Returns:
+        logging.Logger: The logger for the given name
+    """
+    return logging.getLogger(name)
+
+
+class RequestIDFilter(logging.Filter):
+    """
+    Attach the current request ID to log records.
+    
+    The ID is read from request_id_var in the thread that emits the
+    record, so the filter must sit on the logger or the queue handler,
+    not on a handler run by the queue listener. A request_id passed
+    explicitly through extra= is kept.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Add the request_id attribute to a record.
+        
+        Args:
+            record: The log record to annotate
+            
+        Returns:
+            bool: Always True; no records are dropped
+        """
+        if getattr(record, "request_id", None) is None:
+            record.request_id = request_id_var.get()
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format log records as single-line JSON objects.
+    
+    Records are serialized with orjson. Fields passed through extra=,
+    such as request_id, are added as top-level keys.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record as JSON.
+        
+        Args:
+            record: The log record to format
+            
+        Returns:
+            str: The JSON-encoded record
+        """
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        
+        return orjson.dumps(entry, default=str).decode()
+
+
+class LocalQueueHandler(QueueHandler):
+    """
+    Queue handler for a listener running in the same process.
+    
+    The message is merged with its arguments before the record is queued,
+    so later changes to those arguments cannot alter it, but formatting
+    (including any traceback) is left to the listener's handler.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for queuing.
+        
+        Args:
+            record: The log record to prepare
+            
+        Returns:
+            logging.LogRecord: The record with its message resolved
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def get_formatter(log_format: Optional[str] = None) -> logging.Formatter:
+    """
+    Get the log formatter for a log format.
+    
+    Args:
+        log_format: "json" or "text"; defaults to the configured format
+        
+    Returns:
+        logging.Formatter: The matching formatter
+    """
+    if log_format is None:
+        log_format = get_settings().logging.format
+    if log_format == "json":
+        return JSONFormatter()
+    return logging.Formatter(TEXT_FORMAT)
+
 
 def setup_logging() -> None:
     """Set up logging configuration for the application."""
     settings = get_settings()
+    root_logger = logging.getLogger()
+    
+    if not root_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(get_formatter(settings.logging.format))
+        
+        # Log calls only enqueue the record; a background listener thread
+        # does the formatting and stream I/O behind the handler lock
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        queue_handler = LocalQueueHandler(log_queue)
+        queue_handler.addFilter(RequestIDFilter())
+        root_logger.addHandler(queue_handler)
     
     # Configure logging based on settings
-    logging.basicConfig(
-        level=getattr(logging, settings.logging.level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    root_logger.setLevel(getattr(logging, settings.logging.level))
     
     # Set up specific logger levels if needed
     if settings.debug:
@@ -40,18 +185,23 @@ def get_logger_config() -> Dict[str, Any]:
         "disable_existing_loggers": False,
         "formatters": {
             "default": {
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                "format": TEXT_FORMAT,
             },
             "json": {
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                # JSON formatter would be implemented here if needed
+                "()": JSONFormatter,
+            },
+        },
+        "filters": {
+            "request_id": {
+                "()": RequestIDFilter,
             },
         },
         "handlers": {
             "default": {
-                "formatter": "default",
+                "formatter": "json" if settings.logging.format == "json" else "default",
                 "class": "logging.StreamHandler",
                 "stream": "ext://sys.stdout",
+                "filters": ["request_id"],
             },
         },
         "root": {
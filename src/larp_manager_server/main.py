@@ -5,17 +5,39 @@ This module provides the application entry point and basic configuration.
 Most functionality has been moved to specialized modules for better organization.
 """
 
+from functools import lru_cache
+
+from fastapi import FastAPI
+
 from larp_manager_server.app_factory import create_app
 from larp_manager_server.logging_config import setup_logging
 
-# Set up logging
-setup_logging()
 
-# Create the FastAPI app instance
-app = create_app()
+@lru_cache(maxsize=1)
+def get_app() -> FastAPI:
+    """
+    Get the FastAPI application instance.
+    
+    Logging is set up and the app is created on the first call, so tools
+    that import this module without serving requests skip both.
+    
+    Returns:
+        FastAPI: The application instance
+    """
+    setup_logging()
+    return create_app()
+
+
+def __getattr__(name: str) -> FastAPI:
+    """Resolve the module-level app used by ASGI servers lazily."""
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
+    from importlib.util import find_spec
+    
     import uvicorn
     
     from larp_manager_server.config import get_settings
@@ -28,4 +50,6 @@ if __name__ == "__main__":
         port=8000,
         reload=settings.debug,
         log_level=settings.logging.level.lower(),
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "auto",
     )
\ No newline at end of file
@@ -5,26 +5,88 @@ This module provides centralized exception handling for the FastAPI application.
 """
 
 import logging
+import time
+from typing import Optional
 
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
 
 from larp_manager_server.config import get_settings
+from larp_manager_server.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Unhandled exceptions of one type logged in full per one-second window;
+# beyond that only every LOG_SAMPLE_RATE-th one is logged
+LOG_BURST_LIMIT = 10
+LOG_SAMPLE_RATE = 100
+
+# Exception type name -> [window start, exceptions seen in the window]
+_exception_windows: dict[str, list] = {}
+
+
+def _log_unhandled_exception(exc: Exception, request_id: Optional[str] = None) -> None:
+    """
+    Log an unhandled exception, sampling bursts of the same type.
+    
+    The first LOG_BURST_LIMIT exceptions of a type within a second are
+    logged with their traceback. Further ones are sampled and logged
+    without a traceback unless debug logging is enabled.
+    
+    Args:
+        exc: The unhandled exception
+        request_id: ID of the request that raised the exception
+    """
+    exc_type = type(exc).__name__
+    now = time.monotonic()
+    window = _exception_windows.get(exc_type)
+    if window is None or now - window[0] >= 1.0:
+        window = [now, 0]
+        _exception_windows[exc_type] = window
+    window[1] += 1
+    count = window[1]
+    
+    if count <= LOG_BURST_LIMIT:
+        logger.error(
+            "Unhandled exception: %s",
+            exc,
+            exc_info=True,
+            extra={"request_id": request_id, "exc_type": exc_type},
+        )
+    elif (count - LOG_BURST_LIMIT) % LOG_SAMPLE_RATE == 1:
+        logger.error(
+            "Unhandled exception (sampled, %d of this type in the last second): %s",
+            count,
+            exc,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+            extra={"request_id": request_id, "exc_type": exc_type, "sampled": True},
+        )
 
 
 def setup_exception_handlers(app: FastAPI) -> None:
     """Set up global exception handlers for the application."""
+    # Settings don't change while the app runs; read the flag once here
+    debug = get_settings().debug
+    
+    @app.exception_handler(SQLAlchemyError)
+    async def database_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+        """Exception handler for database errors raised by endpoints."""
+        logger.error("Database error: %s", exc)
+        
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"detail": "Database operation failed"}
+        )
     
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
         """Global exception handler for unhandled exceptions."""
-        logger.error(f"Unhandled exception: {exc}", exc_info=True)
-        
-        settings = get_settings()
+        # This handler runs in the outermost middleware, after the request
+        # ID context variable has been reset, so pass the ID explicitly
+        _log_unhandled_exception(exc, getattr(request.state, "request_id", None))
         
-        if settings.debug:
+        if debug:
             # In debug mode, return detailed error information
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
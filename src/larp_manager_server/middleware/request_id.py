@@ -0,0 +1,59 @@
+"""
+Request ID middleware for LARP Manager Server.
+
+This module assigns every HTTP request a correlation ID that is exposed
+to request handlers, echoed in the response headers and attached to all
+log records emitted while the request is handled.
+"""
+
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from larp_manager_server.logging_config import request_id_var
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Longest client-supplied request ID accepted; longer ones are replaced
+MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestIDMiddleware:
+    """
+    ASGI middleware that binds a request ID to each HTTP request.
+    
+    An incoming X-Request-ID header is reused when present, otherwise a
+    new ID is generated. The ID is stored on request.state.request_id and
+    in the request ID context variable used by logging.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if not request_id or len(request_id) > MAX_REQUEST_ID_LENGTH:
+            request_id = uuid.uuid4().hex
+        
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+        
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -5,15 +5,25 @@ This module provides the base SQLAlchemy model class with common fields
 and methods for all models in the application.
 """
 
+import re
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import AbstractSet, Any, Callable, Collection, Dict, Optional
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, String, func, inspect
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Position before each capital letter except the first, for CamelCase to snake_case
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Marks a column whose value is not loaded into the instance __dict__
+_MISSING = object()
+
+# Columns BaseModel.update_from_dict leaves alone unless told otherwise
+_PROTECTED_COLUMNS = frozenset({'id', 'created_at', 'updated_at'})
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -22,13 +32,7 @@ class Base(DeclarativeBase):
     def __tablename__(cls) -> str:
         """Generate table name from class name."""
         # Convert CamelCase to snake_case
-        name = cls.__name__
-        result = []
-        for i, char in enumerate(name):
-            if char.isupper() and i > 0:
-                result.append('_')
-            result.append(char.lower())
-        return ''.join(result)
+        return _CAMEL_CASE_BOUNDARY.sub("_", cls.__name__).lower()
     
     @declared_attr
     def __table_args__(cls) -> Dict[str, Any]:
@@ -79,7 +83,7 @@ class BaseModel(Base, UUIDMixin, TimestampMixin):
     
     __abstract__ = True
     
-    def to_dict(self, exclude: Optional[set] = None) -> Dict[str, Any]:
+    def to_dict(self, exclude: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
         """
         Convert model instance to dictionary.
         
@@ -89,23 +93,27 @@ class BaseModel(Base, UUIDMixin, TimestampMixin):
         Returns:
             Dictionary representation of the model
         """
-        exclude = exclude or set()
+        excluded: Collection[str] = exclude or ()
         result = {}
+        # Loaded column values live in the instance __dict__; reading them
+        # there skips the instrumented attribute descriptor
+        state = self.__dict__
         
-        for column in self.__table__.columns:
-            if column.name not in exclude:
-                value = getattr(self, column.name)
-                # Convert datetime to ISO format string
-                if isinstance(value, datetime):
-                    value = value.isoformat()
-                # Convert UUID to string
-                elif isinstance(value, uuid.UUID):
-                    value = str(value)
-                result[column.name] = value
+        for name, converter in self._serialization_plan():
+            if name not in excluded:
+                value = state.get(name, _MISSING)
+                if value is _MISSING:
+                    # Unloaded or expired column; let SQLAlchemy load it
+                    value = getattr(self, name)
+                if value is not None and converter is not None:
+                    value = converter(value)
+                result[name] = value
         
         return result
     
-    def update_from_dict(self, data: Dict[str, Any], exclude: Optional[set] = None) -> None:
+    def update_from_dict(
+        self, data: Dict[str, Any], exclude: Optional[AbstractSet[str]] = None
+    ) -> None:
         """
         Update model instance from dictionary.
         
@@ -113,24 +121,94 @@ class BaseModel(Base, UUIDMixin, TimestampMixin):
             data: Dictionary with updated values
             exclude: Set of column names to exclude from update
         """
-        exclude = exclude or {'id', 'created_at', 'updated_at'}
+        excluded = exclude or _PROTECTED_COLUMNS
+        attributes = self._attribute_names()
         
         for key, value in data.items():
-            if key not in exclude and hasattr(self, key):
+            # setattr rather than a __dict__ write keeps change tracking
+            if key in attributes and key not in excluded:
                 setattr(self, key, value)
     
     @classmethod
-    def get_column_names(cls) -> list[str]:
-        """Get list of column names for the model."""
-        return [column.name for column in cls.__table__.columns]
+    def _attribute_names(cls) -> frozenset[str]:
+        """
+        Get the names of the mapped attributes update_from_dict may set.
+        
+        These are the mapper's column, relationship and synonym keys,
+        collected once per class.
+        
+        Returns:
+            Frozen set of mapped attribute names
+        """
+        names = cls.__dict__.get("__attribute_names__")
+        if names is None:
+            names = frozenset(inspect(cls).attrs.keys())
+            cls.__attribute_names__ = names
+        return names
+    
+    @classmethod
+    def _serialization_plan(cls) -> tuple[tuple[str, Optional[Callable[[Any], Any]]], ...]:
+        """
+        Get the per-class plan used by to_dict.
+        
+        The plan pairs each column name with the converter for its values:
+        isoformat for datetimes, str for UUIDs and None for values used
+        as they are. It is built from the mapper once per class.
+        
+        Returns:
+            Tuple of (column name, converter) pairs in column order
+        """
+        plan = cls.__dict__.get("__serialization_plan__")
+        if plan is None:
+            entries = []
+            for column in inspect(cls).columns:
+                try:
+                    python_type = column.type.python_type
+                except NotImplementedError:
+                    python_type = None
+                
+                converter: Optional[Callable[[Any], Any]]
+                if python_type is not None and issubclass(python_type, datetime):
+                    converter = datetime.isoformat
+                elif python_type is not None and issubclass(python_type, uuid.UUID):
+                    converter = str
+                else:
+                    converter = None
+                entries.append((column.name, converter))
+            
+            plan = tuple(entries)
+            cls.__serialization_plan__ = plan
+        return plan
+    
+    @classmethod
+    def get_dict_keys(cls) -> frozenset[str]:
+        """Get the keys of the dictionaries to_dict returns, computed once per class."""
+        keys = cls.__dict__.get("__dict_keys__")
+        if keys is None:
+            keys = frozenset(name for name, _ in cls._serialization_plan())
+            cls.__dict_keys__ = keys
+        return keys
+    
+    @classmethod
+    def get_column_names(cls) -> tuple[str, ...]:
+        """Get column names for the model, computed once per class."""
+        names = cls.__dict__.get("__column_names__")
+        if names is None:
+            names = tuple(column.name for column in cls.__table__.columns)
+            cls.__column_names__ = names
+        return names
     
     @classmethod
-    def get_required_columns(cls) -> list[str]:
-        """Get list of required (non-nullable) column names."""
-        return [
-            column.name for column in cls.__table__.columns
-            if not column.nullable and column.default is None
-        ]
+    def get_required_columns(cls) -> tuple[str, ...]:
+        """Get required (non-nullable) column names, computed once per class."""
+        names = cls.__dict__.get("__required_columns__")
+        if names is None:
+            names = tuple(
+                column.name for column in cls.__table__.columns
+                if not column.nullable and column.default is None
+            )
+            cls.__required_columns__ = names
+        return names
     
     def __repr__(self) -> str:
         """String representation of the model."""
@@ -5,14 +5,29 @@ This module provides health check endpoints for monitoring and
 deployment readiness verification.
 """
 
-import logging
+import orjson
+from fastapi import FastAPI, Response, status
+from fastapi.responses import ORJSONResponse
 
-from fastapi import FastAPI, status
-from fastapi.responses import JSONResponse
+from larp_manager_server.database import get_db_manager
+from larp_manager_server.logging_config import get_logger
 
-from larp_manager_server.database import db_manager
+logger = get_logger(__name__)
 
-logger = logging.getLogger(__name__)
+SERVICE_NAME = "larp-manager-server"
+
+# Static probe payloads, built once rather than on every request
+HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "service": SERVICE_NAME,
+    "version": "1.0.0"
+}
+LIVENESS_PAYLOAD = {
+    "status": "alive",
+    "service": SERVICE_NAME
+}
+HEALTH_BODY = orjson.dumps(HEALTH_PAYLOAD)
+LIVENESS_BODY = orjson.dumps(LIVENESS_PAYLOAD)
 
 
 def setup_health_routes(app: FastAPI) -> None:
@@ -21,20 +36,16 @@ def setup_health_routes(app: FastAPI) -> None:
     @app.get("/health", tags=["health"])
     async def health_check():
         """Basic health check endpoint."""
-        return {
-            "status": "healthy",
-            "service": "larp-manager-server",
-            "version": "1.0.0"
-        }
+        return Response(content=HEALTH_BODY, media_type="application/json")
     
     @app.get("/health/db", tags=["health"])
     async def database_health_check():
         """Database health check endpoint."""
         try:
-            health_result = await db_manager.health_check()
+            health_result = await get_db_manager().health_check()
             
             if health_result["status"] == "healthy":
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=status.HTTP_200_OK,
                     content={
                         "status": "healthy",
@@ -42,7 +53,7 @@ def setup_health_routes(app: FastAPI) -> None:
                     }
                 )
             else:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                     content={
                         "status": "unhealthy",
@@ -50,8 +61,8 @@ def setup_health_routes(app: FastAPI) -> None:
                     }
                 )
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
-            return JSONResponse(
+            logger.error("Database health check failed: %s", e)
+            return ORJSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 content={
                     "status": "unhealthy",
@@ -67,10 +78,10 @@ def setup_health_routes(app: FastAPI) -> None:
         """Readiness check endpoint for deployment."""
         try:
             # Check database connectivity
-            db_health = await db_manager.health_check()
+            db_health = await get_db_manager().health_check()
             
             if db_health["status"] != "healthy":
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                     content={
                         "status": "not_ready",
@@ -81,15 +92,17 @@ def setup_health_routes(app: FastAPI) -> None:
             
             # Additional readiness checks can be added here
             
-            return {
-                "status": "ready",
-                "service": "larp-manager-server",
-                "database": db_health
-            }
+            return ORJSONResponse(
+                content={
+                    "status": "ready",
+                    "service": SERVICE_NAME,
+                    "database": db_health
+                }
+            )
             
         except Exception as e:
-            logger.error(f"Readiness check failed: {e}")
-            return JSONResponse(
+            logger.error("Readiness check failed: %s", e)
+            return ORJSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 content={
                     "status": "not_ready",
@@ -102,7 +115,4 @@ def setup_health_routes(app: FastAPI) -> None:
         """Liveness check endpoint for deployment."""
         # This should be a simple check that the application is running
         # and can handle requests
-        return {
-            "status": "alive",
-            "service": "larp-manager-server"
-        }
\ No newline at end of file
+        return Response(content=LIVENESS_BODY, media_type="application/json")
\ No newline at end of file
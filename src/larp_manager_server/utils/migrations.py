@@ -0,0 +1,66 @@
+"""
+Migration helpers for LARP Manager Server.
+
+This module provides utilities for Alembic revision scripts.
+"""
+
+from typing import Iterable
+
+from alembic import op
+from sqlalchemy import text
+
+# Dollar-quote tag for batched blocks; distinct from the common $$ so that
+# statements defining functions can still be batched.
+_BATCH_TAG = "$larp_batch$"
+
+
+def build_batch_sql(statements: Iterable[str]) -> str:
+    """
+    Combine SQL statements into a single PL/pgSQL DO block.
+    
+    Args:
+        statements: SQL statements, with or without trailing semicolons
+        
+    Returns:
+        A single DO statement executing all given statements in order
+        
+    Raises:
+        ValueError: If no statements are given or a statement contains
+            the batch dollar-quote tag
+    """
+    body = []
+    for statement in statements:
+        statement = statement.strip().rstrip(";").strip()
+        if not statement:
+            continue
+        if _BATCH_TAG in statement:
+            raise ValueError(f"Statement must not contain {_BATCH_TAG}")
+        body.append(f"    {statement};")
+    
+    if not body:
+        raise ValueError("At least one statement is required")
+    
+    return "DO {tag}\nBEGIN\n{body}\nEND\n{tag}".format(
+        tag=_BATCH_TAG, body="\n".join(body)
+    )
+
+
+def execute_batch(*statements: str) -> None:
+    """
+    Execute several SQL statements in one database round-trip.
+    
+    Intended for revision scripts that would otherwise call op.execute()
+    once per statement. The statements run in the migration's transaction;
+    statements that cannot run inside a transaction block (such as
+    CREATE INDEX CONCURRENTLY) must not be batched. In offline (--sql)
+    mode each statement is emitted separately to keep the script readable.
+    
+    Args:
+        *statements: SQL statements to execute in order
+    """
+    if op.get_context().as_sql:
+        for statement in statements:
+            op.execute(text(statement))
+        return
+    
+    op.execute(text(build_batch_sql(statements)))
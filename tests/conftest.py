@@ -5,27 +5,29 @@ Test configuration and fixtures for LARP Manager Server tests.
 import asyncio
 import pytest
 from typing import AsyncGenerator
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
-from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.larp_manager_server.config import Settings
 from src.larp_manager_server.api.dependencies import get_db_session
+from src.larp_manager_server.database import DatabaseManager, get_db_manager
 from src.larp_manager_server.models.base import Base
 from src.larp_manager_server.main import app
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def default_settings():
+    """Provide default settings, built once for the test session.
+    
+    Settings are frozen, so tests can share the instance; use
+    model_copy(update=...) to derive a variant.
+    """
+    return Settings()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings():
     """Provide test settings."""
     return Settings(
@@ -48,16 +50,16 @@ def test_settings():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def test_engine(test_settings):
-    """Create test database engine."""
+    """Create test database engine shared by the whole test session."""
     engine = create_async_engine(
         test_settings.database.url,
         echo=test_settings.debug,
         future=True,
     )
     
-    # Create all tables
+    # Create all tables once
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
@@ -67,50 +69,173 @@ async def test_engine(test_settings):
     await engine.dispose()
 
 
-@pytest.fixture
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    async_session = sessionmaker(
-        test_engine,
-        class_=AsyncSession,
+@pytest.fixture(scope="session")
+def test_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Create the session factory shared by the whole test session."""
+    # Commits inside a test only release savepoints of the outer transaction
+    return async_sessionmaker(
         expire_on_commit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
     )
+
+
+@pytest.fixture
+async def test_session(test_engine, test_session_factory) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session rolled back after each test."""
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        
+        async with test_session_factory(bind=connection) as session:
+            yield session
+        
+        await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+async def shared_db_manager(test_settings) -> AsyncGenerator[DatabaseManager, None]:
+    """Create initialized database manager shared by the whole test session."""
+    manager = DatabaseManager(settings=test_settings)
+    await manager.initialize()
+    
+    yield manager
     
-    async with async_session() as session:
-        yield session
+    await manager.close()
+
+
+@pytest.fixture
+async def fresh_global_db_manager() -> AsyncGenerator[DatabaseManager, None]:
+    """
+    Provide the global database manager in its uninitialized state.
+    
+    The manager is closed for the test if needed, and closed again and
+    re-initialized afterwards to match its state before the test.
+    """
+    manager = get_db_manager()
+    was_initialized = manager.is_initialized
+    if was_initialized:
+        await manager.close()
+    
+    yield manager
+    
+    if manager.is_initialized:
+        await manager.close()
+    if was_initialized:
+        await manager.initialize()
+
+
+class DBManagerPool:
+    """
+    Pool of initialized database managers for tests that change manager state.
+    
+    Managers are checked out for one test and returned afterwards with their
+    schema verification flag and health check cache reset, so each test
+    starts from a freshly initialized manager without building an engine.
+    """
+    
+    def __init__(self, settings: Settings, size: int = 2):
+        self.settings = settings
+        self.size = size
+        self._managers: list[DatabaseManager] = []
+        self._available: asyncio.Queue[DatabaseManager] = asyncio.Queue()
+    
+    async def start(self) -> None:
+        """Initialize the pooled managers."""
+        for _ in range(self.size):
+            manager = DatabaseManager(settings=self.settings)
+            await manager.initialize()
+            self._managers.append(manager)
+            self._available.put_nowait(manager)
+    
+    async def acquire(self) -> DatabaseManager:
+        """Check out a manager, waiting for one to be returned if needed."""
+        return await self._available.get()
+    
+    def release(self, manager: DatabaseManager) -> None:
+        """Return a manager to the pool."""
+        manager._schema_verified = False
+        manager._health_check_cache = None
+        manager._health_check_task = None
+        self._available.put_nowait(manager)
+    
+    async def close(self) -> None:
+        """Close all pooled managers."""
+        for manager in self._managers:
+            await manager.close()
+
+
+@pytest.fixture(scope="session")
+async def db_manager_pool(test_settings) -> AsyncGenerator[DBManagerPool, None]:
+    """Create the database manager pool shared by the whole test session."""
+    pool = DBManagerPool(test_settings)
+    await pool.start()
+    
+    yield pool
+    
+    await pool.close()
+
+
+@pytest.fixture
+async def pooled_manager(db_manager_pool) -> AsyncGenerator[DatabaseManager, None]:
+    """Check out an initialized database manager for one test."""
+    manager = await db_manager_pool.acquire()
+    try:
+        yield manager
+    finally:
+        db_manager_pool.release(manager)
 
 
 @pytest.fixture
 def mock_db_session():
-    """Create mock database session for unit tests."""
-    session = MagicMock(spec=AsyncSession)
-    session.begin = MagicMock()
-    session.commit = MagicMock()
-    session.rollback = MagicMock()
-    session.close = MagicMock()
-    return session
+    """Create mock database session for unit tests.
+    
+    Child mocks are created on first access, with coroutine methods such
+    as commit and rollback specced as AsyncMock.
+    """
+    return MagicMock(spec=AsyncSession)
+
+
+@pytest.fixture(scope="session")
+async def app_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create HTTP client shared by the whole test session.
+    
+    Requests are passed straight to the ASGI app on the test event loop.
+    The application lifespan is not entered, so no database connection
+    is opened; tests override or patch database access as needed.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
 
 @pytest.fixture
-def client(test_session):
+def client(app_client, test_session):
     """Create test client with dependency overrides."""
     async def override_get_db():
         yield test_session
     
     app.dependency_overrides[get_db_session] = override_get_db
     
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
     
     # Clean up
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def mock_client():
+def mock_db_manager(monkeypatch):
+    """Replace the database manager used by the health routes with a mock."""
+    manager = MagicMock(spec=DatabaseManager)
+    monkeypatch.setattr(
+        "larp_manager_server.routes.health.get_db_manager",
+        lambda: manager,
+    )
+    return manager
+
+
+@pytest.fixture
+def mock_client(app_client, mock_db_manager):
     """Create test client without database dependencies."""
-    with TestClient(app) as test_client:
-        yield test_client
+    return app_client
 
 
 # Test data fixtures
@@ -142,9 +267,7 @@ def sample_game_data():
 @pytest.fixture
 def async_mock():
     """Create async mock function."""
-    async def _async_mock(*args, **kwargs):
-        return MagicMock()
-    return _async_mock
+    return AsyncMock()
 
 
 # Test markers
@@ -13,31 +13,50 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.larp_manager_server.models.base import BaseModel, NamedModel, DescribedModel
 
 
-class TestBaseModelEntity(BaseModel):
-    """Test model class for testing BaseModel functionality."""
-    
-    __tablename__ = "test_model"
-    
-    name = Column(String(255), nullable=False)
+# Columns every BaseModel subclass inherits
+BASE_FIELDS = {"id", "created_at", "updated_at"}
 
 
-class TestNamedModelEntity(NamedModel):
-    """Test model class for testing NamedModel functionality."""
+@pytest.fixture(scope="module")
+def model_classes():
+    """
+    Define the test model classes for this module.
     
-    __tablename__ = "test_named_model"
-
-
-class TestDescribedModelEntity(DescribedModel):
-    """Test model class for testing DescribedModel functionality."""
+    The classes are declared here rather than at import time, so they are
+    only mapped when the model tests run, and their tables are removed
+    from the shared metadata afterwards.
+    """
+    class TestBaseModelEntity(BaseModel):
+        """Test model class for testing BaseModel functionality."""
+        
+        __tablename__ = "test_model"
+        
+        name = Column(String(255), nullable=False)
+    
+    class TestNamedModelEntity(NamedModel):
+        """Test model class for testing NamedModel functionality."""
+        
+        __tablename__ = "test_named_model"
     
-    __tablename__ = "test_described_model"
+    class TestDescribedModelEntity(DescribedModel):
+        """Test model class for testing DescribedModel functionality."""
+        
+        __tablename__ = "test_described_model"
+    
+    classes = (TestBaseModelEntity, TestNamedModelEntity, TestDescribedModelEntity)
+    yield classes
+    
+    for model_class in classes:
+        BaseModel.metadata.remove(model_class.__table__)
 
 
 class TestBaseModelClass:
     """Test BaseModel class functionality."""
     
-    def test_table_name_generation(self):
+    def test_table_name_generation(self, model_classes):
         """Test automatic table name generation."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         # Test simple class name
         assert TestBaseModelEntity.__tablename__ == "test_model"
         
@@ -49,23 +68,29 @@ class TestBaseModelClass:
         # but we override it in the test class
         assert MyTestModel.__tablename__ == "my_test_model"
     
-    def test_table_schema(self):
+    def test_table_schema(self, model_classes):
         """Test table schema assignment."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity()
         table_args = model.__table_args__
         
         assert table_args["schema"] == "larp_manager"
     
-    def test_uuid_primary_key(self):
+    def test_uuid_primary_key(self, model_classes):
         """Test UUID primary key generation."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity(name="test")
         
         # ID should be generated automatically
         assert model.id is not None
         assert isinstance(model.id, uuid.UUID)
     
-    def test_timestamp_fields(self):
+    def test_timestamp_fields(self, model_classes):
         """Test timestamp field generation."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity(name="test")
         
         # Timestamps should be set automatically
@@ -74,17 +99,17 @@ class TestBaseModelClass:
         assert isinstance(model.created_at, datetime)
         assert isinstance(model.updated_at, datetime)
     
-    def test_to_dict(self):
+    def test_to_dict(self, model_classes):
         """Test model to dictionary conversion."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity(name="test")
         
         result = model.to_dict()
         
         assert isinstance(result, dict)
-        assert "id" in result
-        assert "name" in result
-        assert "created_at" in result
-        assert "updated_at" in result
+        assert result.keys() == TestBaseModelEntity.get_dict_keys()
+        assert result.keys() == BASE_FIELDS | {"name"}
         
         # Check that UUID is converted to string
         assert isinstance(result["id"], str)
@@ -93,8 +118,10 @@ class TestBaseModelClass:
         assert isinstance(result["created_at"], str)
         assert isinstance(result["updated_at"], str)
     
-    def test_to_dict_with_exclude(self):
+    def test_to_dict_with_exclude(self, model_classes):
         """Test model to dictionary conversion with exclusions."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity(name="test")
         
         result = model.to_dict(exclude={"id", "created_at"})
@@ -104,8 +131,10 @@ class TestBaseModelClass:
         assert "name" in result
         assert "updated_at" in result
     
-    def test_update_from_dict(self):
+    def test_update_from_dict(self, model_classes):
         """Test model update from dictionary."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity(name="original")
         original_id = model.id
         original_created_at = model.created_at
@@ -125,8 +154,10 @@ class TestBaseModelClass:
         assert model.id == original_id
         assert model.created_at == original_created_at
     
-    def test_update_from_dict_with_custom_exclude(self):
+    def test_update_from_dict_with_custom_exclude(self, model_classes):
         """Test model update from dictionary with custom exclusions."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity(name="original")
         
         update_data = {
@@ -138,15 +169,28 @@ class TestBaseModelClass:
         # Name should not be updated (excluded)
         assert model.name == "original"
     
-    def test_get_column_names(self):
+    def test_get_column_names(self, model_classes):
         """Test getting column names."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         column_names = TestBaseModelEntity.get_column_names()
         
         expected_columns = {"id", "created_at", "updated_at", "name"}
         assert set(column_names) == expected_columns
+        
+        # Computed once and reused
+        assert isinstance(column_names, tuple)
+        assert TestBaseModelEntity.get_column_names() is column_names
+    
+    def test_base_fields(self, model_classes):
+        """Test that every model class has the base model columns."""
+        for model_class in model_classes:
+            assert BASE_FIELDS <= set(model_class.get_column_names())
     
-    def test_get_required_columns(self):
+    def test_get_required_columns(self, model_classes):
         """Test getting required column names."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         required_columns = TestBaseModelEntity.get_required_columns()
         
         # 'name' should be required (nullable=False, no default)
@@ -159,16 +203,20 @@ class TestBaseModelClass:
         assert "created_at" not in required_columns
         assert "updated_at" not in required_columns
     
-    def test_repr(self):
+    def test_repr(self, model_classes):
         """Test string representation."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity(name="test")
         
         repr_str = repr(model)
         assert "TestBaseModelEntity" in repr_str
         assert str(model.id) in repr_str
     
-    def test_str(self):
+    def test_str(self, model_classes):
         """Test string conversion."""
+        TestBaseModelEntity, _, _ = model_classes
+        
         model = TestBaseModelEntity(name="test")
         
         str_repr = str(model)
@@ -179,17 +227,18 @@ class TestBaseModelClass:
 class TestNamedModelClass:
     """Test NamedModel class functionality."""
     
-    def test_name_field(self):
+    def test_name_field(self, model_classes):
         """Test name field in NamedModel."""
+        _, TestNamedModelEntity, _ = model_classes
+        
         model = TestNamedModelEntity(name="test name")
         
         assert model.name == "test name"
-        assert hasattr(model, "id")
-        assert hasattr(model, "created_at")
-        assert hasattr(model, "updated_at")
     
-    def test_str_with_name(self):
+    def test_str_with_name(self, model_classes):
         """Test string representation with name."""
+        _, TestNamedModelEntity, _ = model_classes
+        
         model = TestNamedModelEntity(name="test name")
         
         str_repr = str(model)
@@ -200,8 +249,10 @@ class TestNamedModelClass:
 class TestDescribedModelClass:
     """Test DescribedModel class functionality."""
     
-    def test_name_and_description_fields(self):
+    def test_name_and_description_fields(self, model_classes):
         """Test name and description fields in DescribedModel."""
+        _, _, TestDescribedModelEntity = model_classes
+        
         model = TestDescribedModelEntity(
             name="test name",
             description="test description"
@@ -209,19 +260,20 @@ class TestDescribedModelClass:
         
         assert model.name == "test name"
         assert model.description == "test description"
-        assert hasattr(model, "id")
-        assert hasattr(model, "created_at")
-        assert hasattr(model, "updated_at")
     
-    def test_optional_description(self):
+    def test_optional_description(self, model_classes):
         """Test that description is optional."""
+        _, _, TestDescribedModelEntity = model_classes
+        
         model = TestDescribedModelEntity(name="test name")
         
         assert model.name == "test name"
         assert model.description is None
     
-    def test_str_with_name(self):
+    def test_str_with_name(self, model_classes):
         """Test string representation with name."""
+        _, _, TestDescribedModelEntity = model_classes
+        
         model = TestDescribedModelEntity(name="test name")
         
         str_repr = str(model)